@@ -22,16 +22,16 @@ __url__ = "https://github.com/datalad/datalad-installer"
 
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterator
-from contextlib import contextmanager, suppress
+from contextlib import contextmanager
 import ctypes
 from dataclasses import InitVar, dataclass, field
 from email import policy
 from email.headerregistry import ContentTypeHeader
 from enum import Enum
-from functools import lru_cache, total_ordering
-from getopt import GetoptError, getopt
+from functools import cached_property, lru_cache, total_ordering
 from html.parser import HTMLParser
 from http.client import HTTPMessage
+import io
 from itertools import groupby
 import json
 import logging
@@ -69,6 +69,16 @@ ON_MACOS = SYSTEM == "Darwin"
 ON_WINDOWS = SYSTEM == "Windows"
 ON_POSIX = ON_LINUX or ON_MACOS
 
+#: Base URL from which to download the standalone conda executable
+CONDA_STANDALONE_URL = "https://repo.anaconda.com/pkgs/misc/conda-execs/"
+
+#: Size of the buffer used when copying HTTP response bodies to disk
+DOWNLOAD_BUFSIZE = 1 << 20  # 1 MiB
+
+#: Downloads of at most this size that only need to be read once (e.g., zip
+#: archives to extract) are kept in memory rather than written to disk
+MEMORY_DOWNLOAD_MAX = 64 << 20  # 64 MiB
+
 USER_AGENT = "datalad-installer/{} ({}) {}/{}".format(
     __version__,
     __url__,
@@ -83,22 +93,28 @@ class SudoConfirm(Enum):
     OK = "ok"
 
 
+#: Mapping from (uppercase) log level names to their numeric values
+LOG_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+}
+
+
 def parse_log_level(level: str) -> int:
     """
     Convert a log level name (case-insensitive) or number to its numeric value
     """
     try:
-        lv = int(level)
+        return LOG_LEVELS[level.upper()]
+    except KeyError:
+        pass
+    try:
+        return int(level)
     except ValueError:
-        levelup = level.upper()
-        if levelup in {"CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"}:
-            ll = getattr(logging, levelup)
-            assert isinstance(ll, int)
-            return ll
-        else:
-            raise UsageError(f"Invalid log level: {level!r}")
-    else:
-        return lv
+        raise UsageError(f"Invalid log level: {level!r}")
 
 
 @dataclass
@@ -132,9 +148,6 @@ class HelpRequest(Immediate):
     topic: Optional[str] = None
 
 
-SHORT_RGX = re.compile(r"-[^-]")
-LONG_RGX = re.compile(r"--[^-].*")
-
 OPTION_COLUMN_WIDTH = 30
 OPTION_HELP_COLUMN_WIDTH = 40
 HELP_GUTTER = 2
@@ -169,9 +182,9 @@ class Option:
         self.help: Optional[str] = help
         for n in names:
             if n.startswith("-"):
-                if LONG_RGX.fullmatch(n):
+                if len(n) > 2 and n[1] == "-" and n[2] != "-":
                     self.longopts.append(n[2:])
-                elif SHORT_RGX.fullmatch(n):
+                elif len(n) == 2 and n[1] != "-":
                     self.shortopts.append(n[1])
                 else:
                     raise ValueError(f"Invalid option: {n!r}")
@@ -322,37 +335,105 @@ class OptionParser:
 
         :param list[str] args: command-line arguments without ``sys.argv[0]``
         """
-        shortspec = ""
-        longspec = []
-        for option in self.options_map.values():
-            for o in option.shortopts:
-                if option.is_flag:
-                    shortspec += o
-                else:
-                    shortspec += f"{o}:"
-            for o in option.longopts:
-                if option.is_flag:
-                    longspec.append(o)
-                else:
-                    longspec.append(f"{o}=")
-        try:
-            optlist, leftovers = getopt(args, shortspec, longspec)
-        except GetoptError as e:
-            raise UsageError(str(e), self.component)
+        r = self.parse_args_at(args, 0)
+        if isinstance(r, Immediate):
+            return r
+        kwargs, i = r
+        return (kwargs, args[i:])
+
+    def parse_args_at(
+        self, args: list[str], start: int
+    ) -> Immediate | tuple[dict[str, Any], int]:
+        """
+        Like `parse_args()`, but starts parsing at index ``start`` of ``args``
+        and returns the index of the first unparsed argument instead of a
+        list of the remaining arguments
+        """
         kwargs: dict[str, Any] = {}
-        for o, a in optlist:
-            option = self.options_map[o]
-            try:
-                ret = option.process(kwargs, a)
-            except ValueError as e:
-                raise UsageError(f"{a!r}: {e}", self.component)
-            except UsageError as e:
-                e.component = self.component
-                raise e
-            else:
+        i = start
+        while i < len(args):
+            arg = args[i]
+            if arg == "--":
+                i += 1
+                break
+            elif arg.startswith("--"):
+                name, eq, value = arg[2:].partition("=")
+                option = self._lookup_long(name)
+                i += 1
+                if option.is_flag:
+                    if eq:
+                        raise UsageError(
+                            f"option --{name} must not have an argument",
+                            self.component,
+                        )
+                    value = ""
+                elif not eq:
+                    if i >= len(args):
+                        raise UsageError(
+                            f"option --{name} requires argument", self.component
+                        )
+                    value = args[i]
+                    i += 1
+                ret = self._process(kwargs, option, value)
                 if ret is not None:
                     return ret
-        return (kwargs, leftovers)
+            elif arg.startswith("-") and arg != "-":
+                i += 1
+                j = 1
+                while j < len(arg):
+                    o = arg[j]
+                    j += 1
+                    try:
+                        option = self.options_map[f"-{o}"]
+                    except KeyError:
+                        raise UsageError(f"option -{o} not recognized", self.component)
+                    if option.is_flag:
+                        value = ""
+                    elif j < len(arg):
+                        value = arg[j:]
+                        j = len(arg)
+                    elif i < len(args):
+                        value = args[i]
+                        i += 1
+                    else:
+                        raise UsageError(
+                            f"option -{o} requires argument", self.component
+                        )
+                    ret = self._process(kwargs, option, value)
+                    if ret is not None:
+                        return ret
+            else:
+                break
+        return (kwargs, i)
+
+    def _lookup_long(self, name: str) -> Option:
+        """
+        Look up a long option by name (sans leading hyphens), accepting any
+        unique prefix of a registered option name
+        """
+        try:
+            return self.options_map[f"--{name}"]
+        except KeyError:
+            pass
+        matches = [
+            opt for key, opt in self.options_map.items() if key.startswith(f"--{name}")
+        ]
+        if not matches:
+            raise UsageError(f"option --{name} not recognized", self.component)
+        elif len(matches) > 1:
+            raise UsageError(f"option --{name} not a unique prefix", self.component)
+        return matches[0]
+
+    def _process(
+        self, kwargs: dict[str, Any], option: Option, value: str
+    ) -> Optional[Immediate]:
+        try:
+            return option.process(kwargs, value)
+        except ValueError as e:
+            raise UsageError(f"{value!r}: {e}", self.component)
+        except UsageError as e:
+            e.component = self.component
+            raise e
 
     def short_help(self, progname: str) -> str:
         if self.component is None:
@@ -418,6 +499,12 @@ class ComponentRequest:
     name: str
     kwargs: dict[str, Any] = field(default_factory=dict)
 
+    #: The `Component` subclass registered under ``name``, if it was already
+    #: looked up when parsing
+    component_cls: Optional[type[Component]] = field(
+        default=None, compare=False, repr=False
+    )
+
 
 @dataclass
 class CondaInstance:
@@ -429,7 +516,7 @@ class CondaInstance:
     #: The name of the environment (`None` for the base environment)
     name: Optional[str]
 
-    @property
+    @cached_property
     def conda_exe(self) -> Path:
         """The path to the Conda executable"""
         if ON_WINDOWS:
@@ -437,7 +524,7 @@ class CondaInstance:
         else:
             return self.basepath / "bin" / "conda"
 
-    @property
+    @cached_property
     def bindir(self) -> Path:
         """
         The directory in which command-line programs provided by packages are
@@ -572,6 +659,10 @@ class DataladInstaller:
     #: Whether "brew update" has been run
     brew_updated: bool = field(init=False, default=False)
 
+    #: Directory under which scratch directories for downloads are created;
+    #: created on first use and deleted on exit
+    scratch_root: Optional[Path] = field(init=False, default=None)
+
     def __post_init__(self) -> None:
         self.installer_stack: list[Installer] = [
             # Lowest priority first
@@ -585,12 +676,6 @@ class DataladInstaller:
             CondaInstaller(self),
         ]
 
-    @classmethod
-    def register_component(cls, component: type[Component]) -> type[Component]:
-        """A decorator for registering concrete `Component` subclasses"""
-        cls.COMPONENTS[component.NAME] = component
-        return component
-
     def __enter__(self) -> DataladInstaller:
         return self
 
@@ -599,6 +684,19 @@ class DataladInstaller:
             # Ensure env write files at least exist
             for p in self.env_write_files:
                 p.touch()
+        if self.scratch_root is not None:
+            # Ignore errors, as cleanup can fail on Windows
+            shutil.rmtree(self.scratch_root, ignore_errors=True)
+            self.scratch_root = None
+
+    def mkscratchdir(self) -> Path:
+        """
+        Create a new empty directory for temporary files (e.g., downloads)
+        that will be deleted when the instance exits
+        """
+        if self.scratch_root is None:
+            self.scratch_root = mktempdir("dl-installer-")
+        return Path(tempfile.mkdtemp(dir=self.scratch_root))
 
     def ensure_env_write_file(self) -> None:
         """If there are no env write files registered, add one"""
@@ -667,13 +765,13 @@ class DataladInstaller:
 
         :param list[str] args: command-line arguments without ``sys.argv[0]``
         """
-        r = cls.OPTION_PARSER.parse_args(args)
+        r = cls.OPTION_PARSER.parse_args_at(args, 0)
         if isinstance(r, Immediate):
             return r
-        global_opts, leftovers = r
+        global_opts, i = r
         components: list[ComponentRequest] = []
-        while leftovers:
-            c = leftovers.pop(0)
+        while i < len(args):
+            c = args[i]
             name, eq, version = c.partition("=")
             if not name:
                 raise UsageError("Component name must be nonempty")
@@ -686,13 +784,19 @@ class DataladInstaller:
                 raise UsageError(f"{name} component does not take a version", name)
             if eq and not version:
                 raise UsageError("Version must be nonempty", name)
-            cr = cparser.parse_args(leftovers)
+            cr = cparser.parse_args_at(args, i + 1)
             if isinstance(cr, Immediate):
                 return cr
-            kwargs, leftovers = cr
+            kwargs, i = cr
             if version:
+                if kwargs.get("standalone"):
+                    raise UsageError(
+                        "--standalone cannot be combined with a version", name
+                    )
                 kwargs["version"] = version
-            components.append(ComponentRequest(name=name, kwargs=kwargs))
+            components.append(
+                ComponentRequest(name=name, kwargs=kwargs, component_cls=component)
+            )
         return ParsedArgs(global_opts, components)
 
     def main(self, argv: Optional[list[str]] = None) -> int:
@@ -742,8 +846,7 @@ class DataladInstaller:
         self.ensure_env_write_file()
         if global_opts.get("sudo"):
             self.sudo_confirm = global_opts["sudo"]
-        for cr in components:
-            self.addcomponent(name=cr.name, **cr.kwargs)
+        self.addcomponents(components)
         ok = True
         for cmd in self.new_commands:
             log.info("%s is now installed at %s", cmd.name, cmd.path)
@@ -778,11 +881,59 @@ class DataladInstaller:
 
     def addcomponent(self, name: str, **kwargs: Any) -> None:
         """Provision the given component"""
-        try:
-            component = self.COMPONENTS[name]
-        except AttributeError:
-            raise ValueError(f"Unknown component: {name}")
-        component(self).provide(**kwargs)
+        self.addcomponents([ComponentRequest(name=name, kwargs=kwargs)])
+
+    def addcomponents(self, components: list[ComponentRequest]) -> None:
+        """
+        Provision the given components in order.  Consecutive installable
+        components that resolve to the same batchable installer (see
+        `Installer.BATCHABLE`) are installed together via a single
+        `Installer.install_batch()` call.
+        """
+        batch: list[tuple[str, dict[str, Any]]] = []
+        batch_installer: Optional[Installer] = None
+
+        def flush() -> None:
+            nonlocal batch
+            if batch:
+                assert batch_installer is not None
+                self.new_commands.extend(batch_installer.install_batch(batch))
+                batch = []
+
+        for cr in components:
+            installer: Optional[Installer] = None
+            try:
+                component_cls = cr.component_cls
+                if component_cls is None:
+                    try:
+                        component_cls = self.COMPONENTS[cr.name]
+                    except KeyError:
+                        raise ValueError(f"Unknown component: {cr.name}")
+                component = component_cls(self)
+                if isinstance(component, InstallableComponent):
+                    kwargs = dict(cr.kwargs)
+                    installer = component.select_installer(
+                        kwargs.pop("method", None), **kwargs
+                    )
+            except Exception:
+                # Install the components queued so far before giving up, as
+                # would happen if they were installed one at a time
+                flush()
+                raise
+            if (
+                installer is None
+                or not installer.BATCHABLE
+                or installer != batch_installer
+            ):
+                flush()
+            if installer is None:
+                component.provide(**cr.kwargs)
+            elif installer.BATCHABLE:
+                batch_installer = installer
+                batch.append((cr.name, kwargs))
+            else:
+                self.new_commands.extend(installer.install(cr.name, **kwargs))
+        flush()
 
     def get_conda(self) -> CondaInstance:
         """
@@ -794,10 +945,9 @@ class DataladInstaller:
         if self.conda_stack:
             return self.conda_stack[-1]
         else:
-            conda_path = shutil.which("conda")
+            conda_path = which("conda")
             if conda_path is not None:
-                basepath = Path(readcmd(conda_path, "info", "--base").strip())
-                return CondaInstance(basepath=basepath, name=None)
+                return CondaInstance(basepath=get_conda_base(conda_path), name=None)
             else:
                 raise RuntimeError("conda not installed")
 
@@ -841,6 +991,15 @@ class Component(ABC):
 
     manager: DataladInstaller
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Register concrete subclasses (those that define `NAME`) in
+        `DataladInstaller.COMPONENTS`
+        """
+        super().__init_subclass__(**kwargs)
+        if "NAME" in vars(cls):
+            DataladInstaller.COMPONENTS[cls.NAME] = cls
+
     @abstractmethod
     def provide(self, **kwargs: Any) -> None:
         ...
@@ -850,7 +1009,6 @@ class Component(ABC):
         raise NotImplementedError
 
 
-@DataladInstaller.register_component
 @dataclass
 class VenvComponent(Component):
     """Creates a Python virtual environment using ``python -m venv``"""
@@ -918,7 +1076,6 @@ class VenvComponent(Component):
         self.manager.installer_stack.append(installer)
 
 
-@DataladInstaller.register_component
 @dataclass
 class MinicondaComponent(Component):
     """Installs Miniconda"""
@@ -948,6 +1105,14 @@ class MinicondaComponent(Component):
                 help="Install Miniconda at the given path",
             ),
             Option("--batch", is_flag=True, help="Run in batch (noninteractive) mode"),
+            Option(
+                "--standalone",
+                is_flag=True,
+                help=(
+                    "Bootstrap the installation with the standalone conda"
+                    " executable instead of the Miniconda installer"
+                ),
+            ),
             Option(
                 "-c",
                 "--channel",
@@ -984,6 +1149,7 @@ class MinicondaComponent(Component):
         python_match: Optional[str] = None,
         extra_args: Optional[list[str]] = None,
         channel: Optional[list[str]] = None,
+        standalone: bool = False,
         version: Optional[str] = None,
         **kwargs: Any,
     ) -> None:
@@ -998,6 +1164,8 @@ class MinicondaComponent(Component):
             # conditions, but so is specifying a nonexistent directory on the
             # command line.)
             path.rmdir()
+        if standalone and version is not None:
+            raise RuntimeError("--standalone cannot be combined with a version")
         if version is None:
             version = "latest"
         log.info("Version: %s", version)
@@ -1006,14 +1174,13 @@ class MinicondaComponent(Component):
             log.info("Batch: True")
         else:
             log.info("Batch: %s", batch)
+        log.info("Standalone: %s", standalone)
         log.info("Channels: %s", channel)
         log.info("Spec: %s", spec)
         log.info("Python Match: %s", python_match)
         log.info("Extra args: %s", extra_args)
         if kwargs:
             log.warning("Ignoring extra component arguments: %r", kwargs)
-        suffix = self.get_platform_suffix()
-        miniconda_script = f"Miniconda3-{version}-{suffix}"
         if python_match is not None:
             vparts: tuple[int, ...]
             if python_match == "major":
@@ -1029,32 +1196,10 @@ class MinicondaComponent(Component):
             if spec is None:
                 spec = []
             spec.append(newspec)
-        log.info("Downloading and running miniconda installer")
-        with tempfile.TemporaryDirectory() as tmpdir:
-            script_path = os.path.join(tmpdir, miniconda_script)
-            download_file(
-                self.get_anaconda_url().rstrip("/") + "/" + miniconda_script,
-                script_path,
-            )
-            log.info("Installing miniconda in %s", path)
-            if ON_WINDOWS:
-                # `path` needs to be absolute when passing it to the installer,
-                # but Path.resolve() is a no-op for non-existent files on
-                # Windows.  Hence, we need to create the directory first.
-                path.mkdir(parents=True, exist_ok=True)
-                cmd = f'start /wait "" {script_path}'
-                if extra_args is not None:
-                    cmd += " ".join(extra_args)
-                cmd += f" /S /D={path.resolve()}"
-                log.info("Running: %s", cmd)
-                subprocess.run(cmd, check=True, shell=True)
-            else:
-                args: list[str | Path] = ["-p", path, "-s"]
-                if batch:
-                    args.append("-b")
-                if extra_args is not None:
-                    args.extend(extra_args)
-                runcmd("bash", script_path, *args)
+        if standalone:
+            self.install_standalone(path, extra_args)
+        else:
+            self.install_miniconda(path, version, batch, extra_args)
         conda_instance = CondaInstance(basepath=path, name=None)
         # As of 2023 June 11, when Conda v23.3.1 on Linux is asked to install
         # the latest DataLad, it installs an incredibly out-of-date version
@@ -1090,6 +1235,62 @@ class MinicondaComponent(Component):
         self.manager.addenv(f"source {shlex.quote(str(path))}/etc/profile.d/conda.sh")
         self.manager.addenv("conda activate base")
 
+    def install_miniconda(
+        self,
+        path: Path,
+        version: str,
+        batch: bool,
+        extra_args: Optional[list[str]],
+    ) -> None:
+        """Download & run the Miniconda installer"""
+        miniconda_script = f"Miniconda3-{version}-{self.get_platform_suffix()}"
+        log.info("Downloading and running miniconda installer")
+        tmpdir = self.manager.mkscratchdir()
+        script_path = tmpdir / miniconda_script
+        download_file(
+            self.get_anaconda_url().rstrip("/") + "/" + miniconda_script,
+            script_path,
+        )
+        log.info("Installing miniconda in %s", path)
+        if ON_WINDOWS:
+            # `path` needs to be absolute when passing it to the installer,
+            # but Path.resolve() is a no-op for non-existent files on
+            # Windows.  Hence, we need to create the directory first.
+            path.mkdir(parents=True, exist_ok=True)
+            cmd = f'start /wait "" {script_path}'
+            if extra_args is not None:
+                cmd += " ".join(extra_args)
+            cmd += f" /S /D={path.resolve()}"
+            log.info("Running: %s", cmd)
+            subprocess.run(cmd, check=True, shell=True)
+        else:
+            args: list[str | Path] = ["-p", path, "-s"]
+            if batch:
+                args.append("-b")
+            if extra_args is not None:
+                args.extend(extra_args)
+            runcmd("bash", script_path, *args)
+
+    def install_standalone(self, path: Path, extra_args: Optional[list[str]]) -> None:
+        """
+        Download the standalone conda executable and use it to create a base
+        environment containing conda at ``path``
+        """
+        log.info("Downloading and running standalone conda")
+        tmpdir = self.manager.mkscratchdir()
+        exe_path = tmpdir / "conda.exe"
+        download_file(
+            f"{CONDA_STANDALONE_URL}conda-latest-{self.get_conda_subdir()}.exe",
+            exe_path,
+        )
+        os.chmod(exe_path, 0o755)
+        log.info("Installing conda in %s", path)
+        args: list[str | Path] = ["create", "--yes", "--prefix", path]
+        if extra_args is not None:
+            args.extend(extra_args)
+        args.append("conda")
+        runcmd(exe_path, *args)
+
     @staticmethod
     def get_anaconda_url() -> str:
         return os.environ.get("ANACONDA_URL") or "https://repo.anaconda.com/miniconda/"
@@ -1109,6 +1310,23 @@ class MinicondaComponent(Component):
         else:
             raise RuntimeError(f"E: Unsupported OS: {SYSTEM}")
 
+    @staticmethod
+    def get_conda_subdir() -> str:
+        if ON_LINUX:
+            return "linux-64"
+        elif ON_MACOS:
+            arch = platform.machine().lower()
+            if arch == "x86_64":
+                return "osx-64"
+            elif arch == "arm64":
+                return "osx-arm64"
+            else:
+                raise RuntimeError(f"E: Unsupported architecture: {arch}")
+        elif ON_WINDOWS:
+            return "win-64"
+        else:
+            raise RuntimeError(f"E: Unsupported OS: {SYSTEM}")
+
     @classmethod
     def show_topic_help(cls, topic: str) -> None:
         assert topic == "versions"
@@ -1139,7 +1357,6 @@ class MinicondaComponent(Component):
             print("Nothing found!")
 
 
-@DataladInstaller.register_component
 @dataclass
 class CondaEnvComponent(Component):
     """Creates a Conda environment"""
@@ -1204,7 +1421,6 @@ class CondaEnvComponent(Component):
         self.manager.addenv(f"conda activate {shlex.quote(cname)}")
 
 
-@DataladInstaller.register_component
 @dataclass
 class NeurodebianComponent(Component):
     """Installs & configures NeuroDebian"""
@@ -1240,43 +1456,44 @@ class NeurodebianComponent(Component):
             stderr=subprocess.DEVNULL,
         )
         apt_file = Path("/etc/apt/sources.list.d/neurodebian.sources.list")
-        if r.returncode != 0 and "o=NeuroDebian" not in readcmd("apt-cache", "policy"):
+        if r.returncode != 0 and "o=NeuroDebian" not in get_apt_cache_policy():
             log.info("NeuroDebian not available in APT and repository not configured")
             log.info("Configuring NeuroDebian APT repository")
             release = get_version_codename()
             log.debug("Detected version codename: %r", release)
-            with tempfile.TemporaryDirectory() as tmpdir:
-                sources_file = os.path.join(tmpdir, "neurodebian.sources.list")
-                download_file(
-                    f"http://neuro.debian.net/lists/{release}.{self.DOWNLOAD_SERVER}.libre",
-                    sources_file,
+            tmpdir = self.manager.mkscratchdir()
+            sources_file = tmpdir / "neurodebian.sources.list"
+            download_file(
+                f"http://neuro.debian.net/lists/{release}.{self.DOWNLOAD_SERVER}.libre",
+                sources_file,
+            )
+            with open(sources_file) as fp:
+                log.info(
+                    "Adding the following contents to sources.list.d:\n\n%s",
+                    textwrap.indent(fp.read(), " " * 4),
                 )
-                with open(sources_file) as fp:
-                    log.info(
-                        "Adding the following contents to sources.list.d:\n\n%s",
-                        textwrap.indent(fp.read(), " " * 4),
-                    )
+            self.manager.sudo(
+                "cp",
+                "-i",
+                sources_file,
+                str(apt_file),
+            )
+            try:
                 self.manager.sudo(
-                    "cp",
-                    "-i",
-                    sources_file,
-                    str(apt_file),
+                    "apt-key",
+                    "adv",
+                    "--recv-keys",
+                    "--keyserver",
+                    "hkp://pool.sks-keyservers.net:80",
+                    self.KEY_FINGERPRINT,
                 )
-                try:
-                    self.manager.sudo(
-                        "apt-key",
-                        "adv",
-                        "--recv-keys",
-                        "--keyserver",
-                        "hkp://pool.sks-keyservers.net:80",
-                        self.KEY_FINGERPRINT,
-                    )
-                except subprocess.CalledProcessError:
-                    log.info("apt-key command failed; downloading key directly")
-                    keyfile = os.path.join(tmpdir, "neuro.debian.net.asc")
-                    download_file(self.KEY_URL, keyfile)
-                    self.manager.sudo("apt-key", "add", keyfile)
+            except subprocess.CalledProcessError:
+                log.info("apt-key command failed; downloading key directly")
+                keyfile = tmpdir / "neuro.debian.net.asc"
+                download_file(self.KEY_URL, keyfile)
+                self.manager.sudo("apt-key", "add", keyfile)
             self.manager.sudo("apt-get", "update")
+            get_apt_cache_policy.cache_clear()
         self.manager.sudo(
             "apt-get",
             "install",
@@ -1308,6 +1525,9 @@ class NeurodebianComponent(Component):
                     runcmd("nd-configurerepo", *args)
                     return
             raise
+        finally:
+            # nd-configurerepo updates the APT sources & cache
+            get_apt_cache_policy.cache_clear()
 
 
 @dataclass
@@ -1320,15 +1540,17 @@ class InstallableComponent(Component):
     INSTALLERS: ClassVar[dict[str, type[Installer]]] = {}
 
     @classmethod
-    def register_installer(cls, installer: type[Installer]) -> type[Installer]:
-        """A decorator for registering concrete `Installer` subclasses"""
+    def add_installer(cls, installer: type[Installer]) -> None:
+        """
+        Register an `Installer` subclass as an installation method for the
+        component
+        """
         cls.INSTALLERS[installer.NAME] = installer
         methods = cls.OPTION_PARSER.options_map["--method"].choices
         assert methods is not None
         methods.append(installer.NAME)
         for opt in installer.OPTIONS:
             cls.OPTION_PARSER.add_option(opt)
-        return installer
 
     def get_installer(self, name: str) -> Installer:
         """Retrieve & instantiate the installer with the given name"""
@@ -1338,25 +1560,32 @@ class InstallableComponent(Component):
             raise ValueError(f"Unknown installation method: {name}")
         return installer_cls(self.manager)
 
-    def provide(self, method: Optional[str] = None, **kwargs: Any) -> None:
+    def select_installer(
+        self, method: Optional[str] = None, **kwargs: Any
+    ) -> Installer:
+        """
+        Return the installer for the given method, or, if the method is
+        `None` or ``"auto"``, the highest-priority installer on the manager's
+        stack that supports installing this component
+        """
         if method is not None and method != "auto":
-            bins = self.get_installer(method).install(self.NAME, **kwargs)
-        else:
-            for installer in reversed(self.manager.installer_stack):
-                try:
-                    log.debug("Attempting to install via %s", installer.NAME)
-                    bins = installer.install(self.NAME, **kwargs)
-                except MethodNotSupportedError as e:
-                    log.debug("Installation method not supported: %s", e)
-                    pass
-                else:
-                    break
+            return self.get_installer(method)
+        for installer in reversed(self.manager.installer_stack):
+            try:
+                log.debug("Attempting to install via %s", installer.NAME)
+                installer.check_component(self.NAME, **kwargs)
+            except MethodNotSupportedError as e:
+                log.debug("Installation method not supported: %s", e)
+                pass
             else:
-                raise RuntimeError(f"No viable installation method for {self.NAME}")
-        self.manager.new_commands.extend(bins)
+                return installer
+        raise RuntimeError(f"No viable installation method for {self.NAME}")
+
+    def provide(self, method: Optional[str] = None, **kwargs: Any) -> None:
+        installer = self.select_installer(method, **kwargs)
+        self.manager.new_commands.extend(installer.install(self.NAME, **kwargs))
 
 
-@DataladInstaller.register_component
 @dataclass
 class GitAnnexComponent(InstallableComponent):
     """Installs git-annex"""
@@ -1378,7 +1607,6 @@ class GitAnnexComponent(InstallableComponent):
     )
 
 
-@DataladInstaller.register_component
 @dataclass
 class DataladComponent(InstallableComponent):
     """Installs Datalad"""
@@ -1400,7 +1628,6 @@ class DataladComponent(InstallableComponent):
     )
 
 
-@DataladInstaller.register_component
 @dataclass
 class RCloneComponent(InstallableComponent):
     """Installs rclone"""
@@ -1422,7 +1649,6 @@ class RCloneComponent(InstallableComponent):
     )
 
 
-@DataladInstaller.register_component
 @dataclass
 class GitAnnexRemoteRCloneComponent(InstallableComponent):
     """Installs git-annex-remote-rclone"""
@@ -1456,8 +1682,24 @@ class Installer(ABC):
     #: (installer-specific package IDs, list of installed programs) pairs
     PACKAGES: ClassVar[dict[str, tuple[str, list[Command]]]]
 
+    #: Whether consecutive requests for components that resolve to the same
+    #: installer should be passed to `install_batch()` together
+    BATCHABLE: ClassVar[bool] = False
+
     manager: DataladInstaller
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Register concrete subclasses (those that define `NAME`) as installation
+        methods for each of the components in their `PACKAGES`
+        """
+        super().__init_subclass__(**kwargs)
+        if "NAME" in vars(cls):
+            for name in cls.PACKAGES:
+                component = DataladInstaller.COMPONENTS[name]
+                assert issubclass(component, InstallableComponent)
+                component.add_installer(cls)
+
     def install(self, component: str, **kwargs: Any) -> list[InstalledCommand]:
         """
         Installs a given component.  Raises `MethodNotSupportedError` if the
@@ -1465,15 +1707,40 @@ class Installer(ABC):
         not support installing the given component.  Returns a list of
         (command, Path) pairs for each installed program.
         """
+        package, commands = self.check_component(component, **kwargs)
+        bindir = self.install_package(package, **kwargs)
+        return [cmd.in_bindir(bindir) for cmd in commands]
+
+    def install_batch(
+        self, requests: list[tuple[str, dict[str, Any]]]
+    ) -> list[InstalledCommand]:
+        """
+        Installs multiple components, given as (component, kwargs) pairs.
+        Installers that can install several packages in a single transaction
+        override this; the default implementation installs each component in
+        turn.
+        """
+        bins: list[InstalledCommand] = []
+        for component, kwargs in requests:
+            bins.extend(self.install(component, **kwargs))
+        return bins
+
+    def check_component(
+        self, component: str, **kwargs: Any
+    ) -> tuple[str, list[Command]]:
+        """
+        Raises `MethodNotSupportedError` if the installation method is not
+        supported on the system or the method does not support installing the
+        given component; otherwise, returns the installer-specific package ID
+        and list of programs for the component.
+        """
         self.assert_supported_system(**kwargs)
         try:
-            package, commands = self.PACKAGES[component]
+            return self.PACKAGES[component]
         except KeyError:
             raise MethodNotSupportedError(
                 f"{self.NAME} does not know how to install {component}"
             )
-        bindir = self.install_package(package, **kwargs)
-        return [cmd.in_bindir(bindir) for cmd in commands]
 
     @abstractmethod
     def install_package(self, package: str, **kwargs: Any) -> Path:
@@ -1500,10 +1767,6 @@ EXTRA_ARGS_OPTION = Option(
 )
 
 
-@GitAnnexComponent.register_installer
-@DataladComponent.register_installer
-@RCloneComponent.register_installer
-@GitAnnexRemoteRCloneComponent.register_installer
 @dataclass
 class AptInstaller(Installer):
     """Installs via apt-get"""
@@ -1557,14 +1820,10 @@ class AptInstaller(Installer):
         return Path("/usr/bin")
 
     def assert_supported_system(self, **_kwargs: Any) -> None:
-        if shutil.which("apt-get") is None:
+        if which("apt-get") is None:
             raise MethodNotSupportedError("apt-get command not found")
 
 
-@DataladComponent.register_installer
-@GitAnnexComponent.register_installer
-@RCloneComponent.register_installer
-@GitAnnexRemoteRCloneComponent.register_installer
 @dataclass
 class HomebrewInstaller(Installer):
     """Installs via brew (Homebrew)"""
@@ -1617,11 +1876,10 @@ class HomebrewInstaller(Installer):
         return bin_dir
 
     def assert_supported_system(self, **_kwargs: Any) -> None:
-        if shutil.which("brew") is None:
+        if which("brew") is None:
             raise MethodNotSupportedError("brew command not found")
 
 
-@DataladComponent.register_installer
 @dataclass
 class PipInstaller(Installer):
     """
@@ -1649,7 +1907,7 @@ class PipInstaller(Installer):
     #: installation should be done at the system level
     venv_path: Optional[Path] = None
 
-    @property
+    @cached_property
     def python(self) -> str | Path:
         if self.venv_path is None:
             return sys.executable
@@ -1721,7 +1979,6 @@ class PipInstaller(Installer):
         pass
 
 
-@GitAnnexComponent.register_installer
 @dataclass
 class NeurodebianInstaller(AptInstaller):
     """Installs via apt-get and the NeuroDebian repositories"""
@@ -1734,14 +1991,10 @@ class NeurodebianInstaller(AptInstaller):
 
     def assert_supported_system(self, **kwargs: Any) -> None:
         super().assert_supported_system(**kwargs)
-        if "l=NeuroDebian" not in readcmd("apt-cache", "policy"):
+        if "l=NeuroDebian" not in get_apt_cache_policy():
             raise MethodNotSupportedError("Neurodebian not configured")
 
 
-@GitAnnexComponent.register_installer
-@DataladComponent.register_installer
-@RCloneComponent.register_installer
-@GitAnnexRemoteRCloneComponent.register_installer
 @dataclass
 class DebURLInstaller(Installer):
     """Installs a ``*.deb`` package by URL"""
@@ -1789,27 +2042,27 @@ class DebURLInstaller(Installer):
         log.info("Extra args: %s", extra_args)
         if kwargs:
             log.warning("Ignoring extra installer arguments: %r", kwargs)
-        with tempfile.TemporaryDirectory() as tmpdir:
-            debpath = os.path.join(tmpdir, f"{package}.deb")
-            download_file(url, debpath)
-            if install_dir is not None and "{version}" in str(install_dir):
-                deb_version = readcmd(
-                    "dpkg-deb", "--showformat", "${Version}", "-W", debpath
-                )
-                install_dir = Path(str(install_dir).format(version=deb_version))
-                log.info("Expanded install dir to %s", install_dir)
-            binpath = install_deb(
-                debpath,
-                self.manager,
-                Path("usr/bin"),
-                install_dir=install_dir,
-                extra_args=extra_args,
+        tmpdir = self.manager.mkscratchdir()
+        debpath = tmpdir / f"{package}.deb"
+        download_file(url, debpath)
+        if install_dir is not None and "{version}" in str(install_dir):
+            deb_version = readcmd(
+                "dpkg-deb", "--showformat", "${Version}", "-W", debpath
             )
-            log.debug("Installed program directory: %s", binpath)
-            return binpath
+            install_dir = Path(str(install_dir).format(version=deb_version))
+            log.info("Expanded install dir to %s", install_dir)
+        binpath = install_deb(
+            debpath,
+            self.manager,
+            Path("usr/bin"),
+            install_dir=install_dir,
+            extra_args=extra_args,
+        )
+        log.debug("Installed program directory: %s", binpath)
+        return binpath
 
     def assert_supported_system(self, **kwargs: Any) -> None:
-        if kwargs.get("install_dir") is None and shutil.which("dpkg") is None:
+        if kwargs.get("install_dir") is None and which("dpkg") is None:
             raise MethodNotSupportedError(
                 "Non-dpkg-based systems not supported unless --install-dir is given"
             )
@@ -1827,7 +2080,9 @@ class AutobuildSnapshotInstaller(Installer):
         tmpdir = mktempdir("dl-build-")
         annex_bin = tmpdir / "git-annex.linux"
         log.info("Downloading and extracting under %s", annex_bin)
-        gzfile = tmpdir / "git-annex-standalone-amd64.tar.gz"
+        # Download to a scratch directory so that the tarball is removed on
+        # exit instead of remaining next to the extracted build
+        gzfile = self.manager.mkscratchdir() / "git-annex-standalone-amd64.tar.gz"
         download_file(
             f"https://downloads.kitenet.net/git-annex/{path}"
             "/git-annex-standalone-amd64.tar.gz",
@@ -1838,20 +2093,19 @@ class AutobuildSnapshotInstaller(Installer):
         return annex_bin
 
     def _install_macos(self, path: str) -> Path:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            dmgpath = os.path.join(tmpdir, "git-annex.dmg")
-            download_file(
-                f"https://downloads.kitenet.net/git-annex/{path}/git-annex.dmg",
-                dmgpath,
-            )
-            return install_git_annex_dmg(dmgpath, self.manager)
+        tmpdir = self.manager.mkscratchdir()
+        dmgpath = tmpdir / "git-annex.dmg"
+        download_file(
+            f"https://downloads.kitenet.net/git-annex/{path}/git-annex.dmg",
+            dmgpath,
+        )
+        return install_git_annex_dmg(dmgpath, self.manager)
 
     def assert_supported_system(self, **_kwargs: Any) -> None:
         if not ON_POSIX:
             raise MethodNotSupportedError(f"{SYSTEM} OS not supported by {self.NAME}")
 
 
-@GitAnnexComponent.register_installer
 @dataclass
 class AutobuildInstaller(AutobuildSnapshotInstaller):
     """Installs the latest official build of git-annex from kitenet.net"""
@@ -1873,7 +2127,6 @@ class AutobuildInstaller(AutobuildSnapshotInstaller):
         return binpath
 
 
-@GitAnnexComponent.register_installer
 @dataclass
 class SnapshotInstaller(AutobuildSnapshotInstaller):
     """
@@ -1897,10 +2150,6 @@ class SnapshotInstaller(AutobuildSnapshotInstaller):
         return binpath
 
 
-@GitAnnexComponent.register_installer
-@DataladComponent.register_installer
-@RCloneComponent.register_installer
-@GitAnnexRemoteRCloneComponent.register_installer
 @dataclass
 class CondaInstaller(Installer):
     """Installs via conda"""
@@ -1921,8 +2170,20 @@ class CondaInstaller(Installer):
         ),
     }
 
+    BATCHABLE: ClassVar[bool] = True
+
     conda_instance: Optional[CondaInstance] = None
 
+    def check_component(
+        self, component: str, **kwargs: Any
+    ) -> tuple[str, list[Command]]:
+        package, commands = super().check_component(component, **kwargs)
+        if package in ("git-annex", "git-annex-remote-rclone") and not ON_LINUX:
+            raise MethodNotSupportedError(
+                f"Conda only supports installing {package} on Linux"
+            )
+        return (package, commands)
+
     def install_package(
         self,
         package: str,
@@ -1930,20 +2191,76 @@ class CondaInstaller(Installer):
         extra_args: Optional[list[str]] = None,
         **kwargs: Any,
     ) -> Path:
-        if package in ("git-annex", "git-annex-remote-rclone") and not ON_LINUX:
-            raise MethodNotSupportedError(
-                f"Conda only supports installing {package} on Linux"
-            )
         log.info("Installing %s via conda", package)
-        if self.conda_instance is not None:
-            conda = self.conda_instance
-        else:
-            conda = self.manager.get_conda()
+        conda = self.get_conda()
         log.info("Environment: %s", conda.name)
         log.info("Version: %s", version)
         log.info("Extra args: %s", extra_args)
         if kwargs:
             log.warning("Ignoring extra installer arguments: %r", kwargs)
+        self.run_install(conda, [self.get_package_spec(package, version)], extra_args)
+        binpath = conda.bindir
+        log.debug("Installed program directory: %s", binpath)
+        return binpath
+
+    def install_batch(
+        self, requests: list[tuple[str, dict[str, Any]]]
+    ) -> list[InstalledCommand]:
+        """
+        Install all of the requested components with a single ``conda
+        install`` command so that the solver only runs once.  Components with
+        differing ``--extra-args`` are installed one at a time.
+        """
+        extra_args = requests[0][1].get("extra_args")
+        if len(requests) < 2 or any(
+            kwargs.get("extra_args") != extra_args for _, kwargs in requests
+        ):
+            return super().install_batch(requests)
+        conda = self.get_conda()
+        specs: list[str] = []
+        commands: list[Command] = []
+        for component, kwargs in requests:
+            package, cmds = self.check_component(component, **kwargs)
+            version = kwargs.get("version")
+            log.info("Installing %s via conda", package)
+            log.info("Version: %s", version)
+            extra = {
+                k: v for k, v in kwargs.items() if k not in ("version", "extra_args")
+            }
+            if extra:
+                log.warning("Ignoring extra installer arguments: %r", extra)
+            specs.append(self.get_package_spec(package, version))
+            commands.extend(cmds)
+        log.info("Environment: %s", conda.name)
+        log.info("Extra args: %s", extra_args)
+        self.run_install(conda, specs, extra_args)
+        binpath = conda.bindir
+        log.debug("Installed program directory: %s", binpath)
+        return [cmd.in_bindir(binpath) for cmd in commands]
+
+    def get_conda(self) -> CondaInstance:
+        if self.conda_instance is not None:
+            return self.conda_instance
+        else:
+            return self.manager.get_conda()
+
+    @staticmethod
+    def get_package_spec(package: str, version: Optional[str]) -> str:
+        if version is None:
+            # Ad-hoc workaround for https://github.com/conda-forge/datalad-feedstock/issues/109
+            # we need to request datalad after 'noarch' 0.9.3
+            if package == "datalad":
+                return "datalad>=0.10.0"
+            else:
+                return package
+        else:
+            return f"{package}={version}"
+
+    @staticmethod
+    def run_install(
+        conda: CondaInstance, specs: list[str], extra_args: Optional[list[str]]
+    ) -> None:
+        """Run ``conda install`` for the given package specifiers"""
         cmd: list[str | Path] = [conda.conda_exe, "install"]
         if conda.name is not None:
             cmd.append("--name")
@@ -1951,15 +2268,7 @@ class CondaInstaller(Installer):
         cmd += ["-q", "-c", "conda-forge", "-y"]
         if extra_args is not None:
             cmd.extend(extra_args)
-        if version is None:
-            # Ad-hoc workaround for https://github.com/conda-forge/datalad-feedstock/issues/109
-            # we need to request datalad after 'noarch' 0.9.3
-            if package == "datalad":
-                cmd.append("datalad>=0.10.0")
-            else:
-                cmd.append(package)
-        else:
-            cmd.append(f"{package}={version}")
+        cmd.extend(specs)
         i = 0
         while True:
             try:
@@ -1995,16 +2304,12 @@ class CondaInstaller(Installer):
                         raise
             else:
                 break
-        binpath = conda.bindir
-        log.debug("Installed program directory: %s", binpath)
-        return binpath
 
     def assert_supported_system(self, **_kwargs: Any) -> None:
-        if not self.manager.conda_stack and shutil.which("conda") is None:
+        if not self.manager.conda_stack and which("conda") is None:
             raise MethodNotSupportedError("Conda installation not found")
 
 
-@GitAnnexComponent.register_installer
 @dataclass
 class DataladGitAnnexBuildInstaller(Installer):
     """
@@ -2049,47 +2354,39 @@ class DataladGitAnnexBuildInstaller(Installer):
         if kwargs:
             log.warning("Ignoring extra installer arguments: %r", kwargs)
         assert package == "git-annex"
-        # Try to ignore cleanup errors on Windows:
-        with suppress(NotADirectoryError), tempfile.TemporaryDirectory() as tmpdir_:
-            tmpdir = Path(tmpdir_)
-            if ON_LINUX:
-                self.download("ubuntu", tmpdir, version)
-                (debpath,) = tmpdir.glob("*.deb")
-                if install_dir is None and deb_pkg_installed("git-annex"):
-                    self.manager.sudo(
-                        "dpkg", "--remove", "--ignore-depends=git-annex", "git-annex"
-                    )
-                binpath = install_deb(
-                    debpath,
-                    self.manager,
-                    Path("usr", "bin"),
-                    install_dir=install_dir,
-                )
-            elif ON_MACOS:
-                self.download("macos", tmpdir, version)
-                (dmgpath,) = tmpdir.glob("*.dmg")
-                binpath = install_git_annex_dmg(dmgpath, self.manager)
-            elif ON_WINDOWS:
-                self.download("windows", tmpdir, version)
-                (exepath,) = tmpdir.glob("*.exe")
-                self.manager.run_maybe_elevated(exepath, "/S")
-                binpath = Path("C:/Program Files", "Git", "usr", "bin")
-                self.manager.addpath(binpath)
-            else:
-                raise AssertionError(
-                    "Method should not be called on unsupported platforms"
+        tmpdir = self.manager.mkscratchdir()
+        if ON_LINUX:
+            self.download("ubuntu", tmpdir, version)
+            (debpath,) = tmpdir.glob("*.deb")
+            if install_dir is None and deb_pkg_installed("git-annex"):
+                self.manager.sudo(
+                    "dpkg", "--remove", "--ignore-depends=git-annex", "git-annex"
                 )
+            binpath = install_deb(
+                debpath,
+                self.manager,
+                Path("usr", "bin"),
+                install_dir=install_dir,
+            )
+        elif ON_MACOS:
+            self.download("macos", tmpdir, version)
+            (dmgpath,) = tmpdir.glob("*.dmg")
+            binpath = install_git_annex_dmg(dmgpath, self.manager)
+        elif ON_WINDOWS:
+            self.download("windows", tmpdir, version)
+            (exepath,) = tmpdir.glob("*.exe")
+            self.manager.run_maybe_elevated(exepath, "/S")
+            binpath = Path("C:/Program Files", "Git", "usr", "bin")
+            self.manager.addpath(binpath)
+        else:
+            raise AssertionError("Method should not be called on unsupported platforms")
         log.debug("Installed program directory: %s", binpath)
         return binpath
 
     def assert_supported_system(self, **kwargs: Any) -> None:
         if not (ON_LINUX or ON_MACOS or ON_WINDOWS):
             raise MethodNotSupportedError(f"{SYSTEM} OS not supported by {self.NAME}")
-        elif (
-            ON_LINUX
-            and kwargs.get("install_dir") is None
-            and shutil.which("dpkg") is None
-        ):
+        elif ON_LINUX and kwargs.get("install_dir") is None and which("dpkg") is None:
             raise MethodNotSupportedError(
                 "Non-dpkg-based systems not supported unless --install-dir is given"
             )
@@ -2107,7 +2404,6 @@ class DataladGitAnnexBuildInstaller(Installer):
         )
 
 
-@GitAnnexComponent.register_installer
 @dataclass
 class DataladGitAnnexLatestBuildInstaller(DataladGitAnnexBuildInstaller):
     """
@@ -2130,7 +2426,6 @@ class DataladGitAnnexLatestBuildInstaller(DataladGitAnnexBuildInstaller):
         )
 
 
-@GitAnnexComponent.register_installer
 @dataclass
 class DataladGitAnnexReleaseBuildInstaller(DataladGitAnnexBuildInstaller):
     """Installs git-annex via an asset of a release of datalad/git-annex"""
@@ -2149,7 +2444,6 @@ class DataladGitAnnexReleaseBuildInstaller(DataladGitAnnexBuildInstaller):
         )
 
 
-@GitAnnexComponent.register_installer
 @dataclass
 class DataladPackagesBuildInstaller(Installer):
     """
@@ -2196,65 +2490,56 @@ class DataladPackagesBuildInstaller(Installer):
             )
             version = vfile.read_text().strip()
             log.info("Found latest version: %s", version)
-        # Try to ignore cleanup errors on Windows:
-        with suppress(NotADirectoryError), tempfile.TemporaryDirectory() as tmpdir_:
-            tmpdir = Path(tmpdir_)
-            if ON_LINUX:
-                debfile = f"git-annex-standalone_{version}-1~ndall+1_amd64.deb"
-                debpath = tmpdir / debfile
-                download_file(
-                    f"https://datasets.datalad.org/datalad/packages/neurodebian/{debfile}",
-                    debpath,
-                )
-                if install_dir is None and deb_pkg_installed("git-annex"):
-                    self.manager.sudo(
-                        "dpkg", "--remove", "--ignore-depends=git-annex", "git-annex"
-                    )
-                binpath = install_deb(
-                    debpath,
-                    self.manager,
-                    Path("usr", "bin"),
-                    install_dir=install_dir,
-                )
-            elif ON_WINDOWS:
-                exefile = f"git-annex-installer_{version}_x64.exe"
-                exepath = tmpdir / exefile
-                download_file(
-                    f"https://datasets.datalad.org/datalad/packages/windows/{exefile}",
-                    exepath,
-                )
-                self.manager.run_maybe_elevated(exepath, "/S")
-                binpath = Path("C:/Program Files", "Git", "usr", "bin")
-                self.manager.addpath(binpath)
-            elif ON_MACOS:
-                dmgfile = f"git-annex_{version}_x64.dmg"
-                dmgpath = tmpdir / dmgfile
-                download_file(
-                    f"https://datasets.datalad.org/datalad/packages/osx/{dmgfile}",
-                    dmgpath,
-                )
-                binpath = install_git_annex_dmg(dmgpath, self.manager)
-            else:
-                raise AssertionError(
-                    "Method should not be called on unsupported platforms"
+        tmpdir = self.manager.mkscratchdir()
+        if ON_LINUX:
+            debfile = f"git-annex-standalone_{version}-1~ndall+1_amd64.deb"
+            debpath = tmpdir / debfile
+            download_file(
+                f"https://datasets.datalad.org/datalad/packages/neurodebian/{debfile}",
+                debpath,
+            )
+            if install_dir is None and deb_pkg_installed("git-annex"):
+                self.manager.sudo(
+                    "dpkg", "--remove", "--ignore-depends=git-annex", "git-annex"
                 )
+            binpath = install_deb(
+                debpath,
+                self.manager,
+                Path("usr", "bin"),
+                install_dir=install_dir,
+            )
+        elif ON_WINDOWS:
+            exefile = f"git-annex-installer_{version}_x64.exe"
+            exepath = tmpdir / exefile
+            download_file(
+                f"https://datasets.datalad.org/datalad/packages/windows/{exefile}",
+                exepath,
+            )
+            self.manager.run_maybe_elevated(exepath, "/S")
+            binpath = Path("C:/Program Files", "Git", "usr", "bin")
+            self.manager.addpath(binpath)
+        elif ON_MACOS:
+            dmgfile = f"git-annex_{version}_x64.dmg"
+            dmgpath = tmpdir / dmgfile
+            download_file(
+                f"https://datasets.datalad.org/datalad/packages/osx/{dmgfile}",
+                dmgpath,
+            )
+            binpath = install_git_annex_dmg(dmgpath, self.manager)
+        else:
+            raise AssertionError("Method should not be called on unsupported platforms")
         log.debug("Installed program directory: %s", binpath)
         return binpath
 
     def assert_supported_system(self, **kwargs: Any) -> None:
         if not (ON_LINUX or ON_MACOS or ON_WINDOWS):
             raise MethodNotSupportedError(f"{SYSTEM} OS not supported by {self.NAME}")
-        elif (
-            ON_LINUX
-            and kwargs.get("install_dir") is None
-            and shutil.which("dpkg") is None
-        ):
+        elif ON_LINUX and kwargs.get("install_dir") is None and which("dpkg") is None:
             raise MethodNotSupportedError(
                 "Non-dpkg-based systems not supported unless --install-dir is given"
             )
 
 
-@GitAnnexComponent.register_installer
 @dataclass
 class DMGInstaller(Installer):
     """Installs a local ``*.dmg`` file"""
@@ -2295,7 +2580,6 @@ class DMGInstaller(Installer):
             raise MethodNotSupportedError(f"{SYSTEM} OS not supported by {self.NAME}")
 
 
-@GitAnnexRemoteRCloneComponent.register_installer
 @dataclass
 class GARRCGitHubInstaller(Installer):
     """Installs git-annex-remote-rclone from a tag on GitHub"""
@@ -2356,7 +2640,6 @@ class GARRCGitHubInstaller(Installer):
             raise MethodNotSupportedError(f"{SYSTEM} OS not supported by {self.NAME}")
 
 
-@RCloneComponent.register_installer
 @dataclass
 class DownloadsRCloneInstaller(Installer):
     """Installs rclone via downloads.rclone.org"""
@@ -2426,29 +2709,28 @@ class DownloadsRCloneInstaller(Installer):
             binname = "rclone.exe"
         else:
             raise AssertionError("Method should not be called on unsupported platforms")
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-            url = "https://downloads.rclone.org/"
-            if version is None:
-                url += f"rclone-current-{ostype}-{arch}.zip"
-            else:
-                if not version.startswith("v"):
-                    version = "v" + version
-                url += f"{version}/rclone-{version}-{ostype}-{arch}.zip"
-            download_zipfile(url, tmppath)
-            (contents,) = tmppath.iterdir()
-            bin_dir.mkdir(parents=True, exist_ok=True)
-            if ON_POSIX:
-                # Although the rclone program is marked executable in the zip,
-                # Python does not preserve this bit when unarchiving.
-                (contents / binname).chmod(0o755)
-            self.manager.move_maybe_elevated(contents / binname, bin_dir / binname)
-            if man_dir is not None:
-                man1_dir = man_dir / "man1"
-                man1_dir.mkdir(parents=True, exist_ok=True)
-                self.manager.move_maybe_elevated(
-                    contents / "rclone.1", man1_dir / "rclone.1"
-                )
+        tmppath = self.manager.mkscratchdir()
+        url = "https://downloads.rclone.org/"
+        if version is None:
+            url += f"rclone-current-{ostype}-{arch}.zip"
+        else:
+            if not version.startswith("v"):
+                version = "v" + version
+            url += f"{version}/rclone-{version}-{ostype}-{arch}.zip"
+        download_zipfile(url, tmppath)
+        (contents,) = tmppath.iterdir()
+        bin_dir.mkdir(parents=True, exist_ok=True)
+        if ON_POSIX:
+            # Although the rclone program is marked executable in the zip,
+            # Python does not preserve this bit when unarchiving.
+            (contents / binname).chmod(0o755)
+        self.manager.move_maybe_elevated(contents / binname, bin_dir / binname)
+        if man_dir is not None:
+            man1_dir = man_dir / "man1"
+            man1_dir.mkdir(parents=True, exist_ok=True)
+            self.manager.move_maybe_elevated(
+                contents / "rclone.1", man1_dir / "rclone.1"
+            )
         log.debug("Installed program directory: %s", bin_dir)
         if str(bin_dir) not in os.environ.get("PATH", "").split(os.pathsep):
             self.manager.addpath(bin_dir)
@@ -2458,6 +2740,12 @@ class DownloadsRCloneInstaller(Installer):
         pass
 
 
+#: Number of workflow runs to request per page when searching for artifacts.
+#: The first run almost always has one, so there is no point in fetching the
+#: API's default of 30.
+RUNS_PER_PAGE = 5
+
+
 class GitHubClient:
     def __init__(self, auth_required: bool = True) -> None:
         token = os.environ.get("GITHUB_TOKEN")
@@ -2526,7 +2814,8 @@ class GitHubClient:
         `RuntimeError` is raised.
         """
         log.info("Getting archive download URL from %s", artifacts_url)
-        artifacts = self.getjson(artifacts_url)
+        # `total_count` covers all artifacts, so one entry is enough here
+        artifacts = self.getjson(f"{artifacts_url}?per_page=1")
         if artifacts["total_count"] < 1:
             log.debug("No artifacts found")
             return None
@@ -2546,7 +2835,8 @@ class GitHubClient:
         """
         runs_url = (
             f"https://api.github.com/repos/{repo}/actions/workflows/{workflow}"
-            f"/runs?branch={branch}"
+            f"/runs?branch={branch}&exclude_pull_requests=true"
+            f"&per_page={RUNS_PER_PAGE}"
         )
         log.info("Getting artifacts_url from %s", runs_url)
         for run in self.get_workflow_runs(runs_url):
@@ -2576,7 +2866,8 @@ class GitHubClient:
         """
         runs_url = (
             f"https://api.github.com/repos/{repo}/actions/workflows/{workflow}"
-            f"/runs?status=success&branch={branch}"
+            f"/runs?status=success&branch={branch}&exclude_pull_requests=true"
+            f"&per_page={RUNS_PER_PAGE}"
         )
         log.info("Getting artifacts_url from %s", runs_url)
         for run in self.get_workflow_runs(runs_url):
@@ -2748,6 +3039,69 @@ def download_file(
     Download a file from ``url``, saving it at ``path``.  Optional ``headers``
     are sent in the HTTP request.
     """
+    with open(path, "wb") as fp:
+        download_fileobj(url, fp, headers)
+
+
+def download_fileobj(
+    url: str, fp: IO[bytes], headers: Optional[dict[str, str]] = None
+) -> None:
+    """
+    Download a file from ``url``, writing it to the seekable binary file
+    object ``fp``.  Optional ``headers`` are sent in the HTTP request.
+    """
+    start = fp.tell()
+
+    def rewind(_size: Optional[int]) -> IO[bytes]:
+        fp.seek(start)
+        fp.truncate()
+        return fp
+
+    _download(url, rewind, headers)
+
+
+def download_to_buffer(url: str, headers: Optional[dict[str, str]] = None) -> IO[bytes]:
+    """
+    Download a file from ``url`` into a new anonymous seekable buffer,
+    positioned at the start.  The buffer is kept in memory if the server
+    reports a size of at most `MEMORY_DOWNLOAD_MAX` bytes and is an unnamed
+    temporary file otherwise.  Optional ``headers`` are sent in the HTTP
+    request.
+    """
+    buf: Optional[IO[bytes]] = None
+
+    def new_buffer(size: Optional[int]) -> IO[bytes]:
+        nonlocal buf
+        if buf is not None:
+            buf.close()
+        if size is not None and size <= MEMORY_DOWNLOAD_MAX:
+            buf = io.BytesIO()
+        else:
+            buf = tempfile.TemporaryFile()
+        return buf
+
+    try:
+        _download(url, new_buffer, headers)
+    except BaseException:
+        if buf is not None:
+            buf.close()
+        raise
+    assert buf is not None
+    buf.seek(0)
+    return buf
+
+
+def _download(
+    url: str,
+    open_dest: Callable[[Optional[int]], IO[bytes]],
+    headers: Optional[dict[str, str]] = None,
+) -> None:
+    """
+    Download a file from ``url``, retrying on server & connection errors.  On
+    each attempt, ``open_dest`` is called with the size of the response body
+    (if known) and must return an empty seekable binary file object to write
+    the body to.
+    """
     log.info("Downloading %s", url)
     if headers is None:
         headers = {}
@@ -2757,11 +3111,15 @@ def download_file(
     while True:
         try:
             with urlopen(req) as r:
-                with open(path, "wb") as fp:
-                    shutil.copyfileobj(r, fp)
                 if "content-length" in r.headers:
-                    size = int(r.headers["Content-Length"])
-                    fsize = os.path.getsize(path)
+                    size: Optional[int] = int(r.headers["Content-Length"])
+                else:
+                    size = None
+                fp = open_dest(size)
+                start = fp.tell()
+                shutil.copyfileobj(r, fp, DOWNLOAD_BUFSIZE)
+                if size is not None:
+                    fsize = fp.tell() - start
                     if fsize < size:
                         raise URLError(
                             f"only {fsize} out of {size} bytes were received"
@@ -2797,12 +3155,11 @@ def download_zipfile(
     """
     Downloads the zipfile from ``zip_url`` and expands it in ``target_dir``
     """
-    zippath = download_to_tempfile(zip_url, suffix=".zip", headers=headers)
-    log.debug("Unzipping in %s", target_dir)
-    with ZipFile(str(zippath)) as zipf:
-        target_dir.mkdir(parents=True, exist_ok=True)
-        zipf.extractall(str(target_dir))
-    zippath.unlink()
+    with download_to_buffer(zip_url, headers) as fp:
+        log.debug("Unzipping in %s", target_dir)
+        with ZipFile(fp) as zipf:
+            target_dir.mkdir(parents=True, exist_ok=True)
+            zipf.extractall(target_dir)
 
 
 def compose_pip_requirement(
@@ -2812,17 +3169,13 @@ def compose_pip_requirement(
     extras: Optional[str] = None,
 ) -> str:
     """Compose a PEP 503 requirement specifier"""
-    req = package
-    if extras is not None:
-        req += f"[{extras}]"
+    ext = f"[{extras}]" if extras is not None else ""
     if urlspec is None:
-        if version is not None:
-            req += f"=={version}"
+        ver = f"=={version}" if version is not None else ""
+        return f"{package}{ext}{ver}"
     else:
-        req += f" @ {urlspec}"
-        if version is not None:
-            req += f"@{version}"
-    return req
+        ver = f"@{version}" if version is not None else ""
+        return f"{package}{ext} @ {urlspec}{ver}"
 
 
 def mktempdir(prefix: str) -> Path:
@@ -2832,8 +3185,9 @@ def mktempdir(prefix: str) -> Path:
 
 def runcmd(*args: str | Path, **kwargs: Any) -> subprocess.CompletedProcess:
     """Run (and log) a given command.  Raise an error if it fails."""
-    arglist = [str(a) for a in args]
-    log.info("Running: %s", " ".join(map(shlex.quote, arglist)))
+    arglist = [os.fspath(a) for a in args]
+    if log.isEnabledFor(logging.INFO):
+        log.info("Running: %s", " ".join(map(shlex.quote, arglist)))
     return subprocess.run(arglist, check=True, **kwargs)
 
 
@@ -2849,9 +3203,21 @@ def install_git_annex_dmg(dmgpath: str | Path, manager: DataladInstaller) -> Pat
     if platform.machine() == "arm64":
         log.info("M1 Mac detected; installing Rosetta")
         runcmd("/usr/sbin/softwareupdate", "--install-rosetta", "--agree-to-license")
-    runcmd("hdiutil", "attach", dmgpath)
-    runcmd("rsync", "-a", "/Volumes/git-annex/git-annex.app", "/Applications/")
-    runcmd("hdiutil", "detach", "/Volumes/git-annex/")
+    mountpoint = manager.mkscratchdir()
+    runcmd(
+        "hdiutil",
+        "attach",
+        "-nobrowse",
+        "-noautoopen",
+        "-readonly",
+        "-mountpoint",
+        mountpoint,
+        dmgpath,
+    )
+    try:
+        runcmd("ditto", mountpoint / "git-annex.app", "/Applications/git-annex.app")
+    finally:
+        runcmd("hdiutil", "detach", mountpoint)
     annex_bin = Path("/Applications/git-annex.app/Contents/MacOS")
     manager.addpath(annex_bin)
     return annex_bin
@@ -2878,12 +3244,12 @@ def install_deb(
         assert os.path.isabs(debpath)
         install_dir.mkdir(parents=True, exist_ok=True)
         install_dir = install_dir.resolve()
-        with tempfile.TemporaryDirectory() as tmpdir:
-            oldpwd = os.getcwd()
-            os.chdir(tmpdir)
-            runcmd("ar", "-x", debpath)
-            runcmd("tar", "-C", install_dir, "-xzf", "data.tar.gz")
-            os.chdir(oldpwd)
+        tmpdir = manager.mkscratchdir()
+        oldpwd = os.getcwd()
+        os.chdir(tmpdir)
+        runcmd("ar", "-x", debpath)
+        runcmd("tar", "-C", install_dir, "-xzf", "data.tar.gz")
+        os.chdir(oldpwd)
         manager.addpath(install_dir / bin_path)
         return install_dir / bin_path
 
@@ -2981,11 +3347,36 @@ def check_exists(path: Path) -> bool:
     return os.path.exists(path)
 
 
+@lru_cache()
+def which(cmd: str) -> Optional[str]:
+    """
+    Memoized `shutil.which()`, for probing for external commands that are not
+    expected to appear or disappear during a run
+    """
+    return shutil.which(cmd)
+
+
+@lru_cache()
+def get_conda_base(conda_path: str) -> Path:
+    """Return the base directory of the Conda installation at ``conda_path``"""
+    return Path(readcmd(conda_path, "info", "--base").strip())
+
+
 @lru_cache()
 def get_brew_bin_dir() -> Path:
     return Path(readcmd("brew", "--prefix").rstrip(os.linesep)) / "bin"
 
 
+@lru_cache()
+def get_apt_cache_policy() -> str:
+    """
+    Return the output of ``apt-cache policy``.  The result is cached, so
+    callers that modify the APT configuration must call
+    ``get_apt_cache_policy.cache_clear()`` afterwards.
+    """
+    return readcmd("apt-cache", "policy")
+
+
 def parse_links(html: str, base_url: Optional[str] = None) -> list[Link]:
     """
     Parse the source of an HTML page and return a list of all hyperlinks found
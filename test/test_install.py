@@ -15,9 +15,13 @@ from datalad_installer import (
     ON_MACOS,
     ON_POSIX,
     ON_WINDOWS,
+    ComponentRequest,
+    CondaInstaller,
+    CondaInstance,
     DataladGitAnnexBuildInstaller,
     DataladGitAnnexLatestBuildInstaller,
     DataladGitAnnexReleaseBuildInstaller,
+    DataladInstaller,
     get_version_codename,
     main,
 )
@@ -60,6 +64,22 @@ def test_install_miniconda(tmp_path: Path) -> None:
     )
 
 
+@pytest.mark.miniconda
+def test_install_miniconda_standalone(tmp_path: Path) -> None:
+    miniconda_path = tmp_path / "conda"
+    r = main(
+        [
+            "datalad_installer.py",
+            "miniconda",
+            "--standalone",
+            "--path",
+            str(miniconda_path),
+        ]
+    )
+    assert r == 0
+    assert (miniconda_path / bin_path("conda")).exists()
+
+
 @pytest.mark.miniconda
 @pytest.mark.parametrize(
     "extra_opts,extra_spec",
@@ -688,3 +708,65 @@ def test_install_latest_rclone_from_downloads_globally(mocker: MockerFixture) ->
         spy.assert_called_once_with("sudo", "mv", "-f", "--", mocker.ANY, str(p))
     assert p.is_file()
     assert p.stat().st_size >= (1 << 20)  # 1 MiB
+
+
+def test_conda_install_batched(mocker: MockerFixture, tmp_path: Path) -> None:
+    m = mocker.patch(
+        "datalad_installer.runcmd",
+        return_value=subprocess.CompletedProcess([], 0, stdout="", stderr=""),
+    )
+    conda = CondaInstance(basepath=tmp_path, name=None)
+    manager = DataladInstaller()
+    manager.conda_stack.append(conda)
+    manager.installer_stack.append(CondaInstaller(manager, conda))
+    manager.addcomponents(
+        [
+            ComponentRequest(name="datalad"),
+            ComponentRequest(name="rclone", kwargs={"version": "1.55.0"}),
+        ]
+    )
+    m.assert_called_once_with(
+        conda.conda_exe,
+        "install",
+        "-q",
+        "-c",
+        "conda-forge",
+        "-y",
+        "datalad>=0.10.0",
+        "rclone=1.55.0",
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    assert [(cmd.name, cmd.path.parent) for cmd in manager.new_commands] == [
+        ("datalad", conda.bindir),
+        ("rclone", conda.bindir),
+    ]
+
+
+def test_conda_batch_installed_before_error(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    m = mocker.patch(
+        "datalad_installer.runcmd",
+        return_value=subprocess.CompletedProcess([], 0, stdout="", stderr=""),
+    )
+    conda = CondaInstance(basepath=tmp_path, name=None)
+    manager = DataladInstaller()
+    manager.conda_stack.append(conda)
+    manager.installer_stack.append(CondaInstaller(manager, conda))
+    with pytest.raises(ValueError, match="Unknown component: nonexistent"):
+        manager.addcomponents(
+            [ComponentRequest(name="datalad"), ComponentRequest(name="nonexistent")]
+        )
+    m.assert_called_once()
+    assert [cmd.name for cmd in manager.new_commands] == ["datalad"]
+
+
+def test_scratch_dirs_removed_on_exit() -> None:
+    with DataladInstaller() as manager:
+        d1 = manager.mkscratchdir()
+        d2 = manager.mkscratchdir()
+        assert d1.is_dir() and d2.is_dir()
+        assert d1 != d2
+        assert d1.parent == d2.parent
+    assert not d1.parent.exists()
@@ -200,12 +200,63 @@ from datalad_installer import (
             ["datalad", "miniconda", "--help-versions"],
             HelpRequest("miniconda", topic="versions"),
         ),
+        (
+            ["-lDEBUG", "datalad"],
+            ParsedArgs(
+                {"log_level": logging.DEBUG},
+                [ComponentRequest(name="datalad")],
+            ),
+        ),
+        (
+            ["--log=15", "datalad"],
+            ParsedArgs(
+                {"log_level": 15},
+                [ComponentRequest(name="datalad")],
+            ),
+        ),
+        (["-lINFO", "-V", "datalad"], VersionRequest()),
+        (["-Vh"], VersionRequest()),
+        # Unique prefixes of long options are accepted
+        (
+            ["--log", "info", "datalad"],
+            ParsedArgs(
+                {"log_level": logging.INFO},
+                [ComponentRequest(name="datalad")],
+            ),
+        ),
+        (
+            ["datalad", "--meth", "pip"],
+            ParsedArgs(
+                {}, [ComponentRequest(name="datalad", kwargs={"method": "pip"})]
+            ),
+        ),
+        # Parsing stops at the first immediate option
+        (["-V", "--bogus"], VersionRequest()),
+        (
+            ["--", "datalad", "--", "git-annex"],
+            ParsedArgs(
+                {},
+                [
+                    ComponentRequest(name="datalad"),
+                    ComponentRequest(name="git-annex"),
+                ],
+            ),
+        ),
     ],
 )
 def test_parse_args(args: list[str], parsed: Immediate | ParsedArgs) -> None:
     assert DataladInstaller.parse_args(args) == parsed
 
 
+def test_parse_args_resolves_components() -> None:
+    r = DataladInstaller.parse_args(["venv", "datalad"])
+    assert isinstance(r, ParsedArgs)
+    assert [cr.component_cls for cr in r.components] == [
+        DataladInstaller.COMPONENTS["venv"],
+        DataladInstaller.COMPONENTS["datalad"],
+    ]
+
+
 @pytest.mark.parametrize(
     "args,message,component",
     [
@@ -229,6 +280,16 @@ def test_parse_args(args: list[str], parsed: Immediate | ParsedArgs) -> None:
             "venv",
         ),
         (["--sudo", "invalid"], "Invalid choice for --sudo option: 'invalid'", None),
+        (["-x"], "option -x not recognized", None),
+        (["-l"], "option -l requires argument", None),
+        (["--version=1"], "option --version must not have an argument", None),
+        (["datalad", "--e", "foo"], "option --e not a unique prefix", "datalad"),
+        (["--bogus", "-V"], "option --bogus not recognized", None),
+        (
+            ["miniconda=py39_4.12.0", "--standalone"],
+            "--standalone cannot be combined with a version",
+            "miniconda",
+        ),
     ],
 )
 def test_parse_args_errors(
@@ -240,6 +301,13 @@ def test_parse_args_errors(
     assert excinfo.value.component == component
 
 
+@pytest.mark.parametrize("name", ["-", "--", "---foo", "-ab"])
+def test_option_invalid_name(name: str) -> None:
+    with pytest.raises(ValueError) as excinfo:
+        Option(name)
+    assert str(excinfo.value) == f"Invalid option: {name!r}"
+
+
 @pytest.mark.parametrize(
     "option,helptext",
     [
@@ -1,11 +1,17 @@
 from __future__ import annotations
 from dataclasses import asdict
+from email.message import Message
+import io
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+from zipfile import ZipFile
 import pytest
+from pytest_mock import MockerFixture
 from datalad_installer import (
     compose_pip_requirement,
+    download_to_buffer,
+    download_zipfile,
     get_url_origin,
     parse_header_links,
     parse_links,
@@ -196,3 +202,49 @@ def test_parse_links() -> None:
 )
 def test_get_url_origin(url: str, scheme: str, host: str, port: int) -> None:
     assert get_url_origin(url) == (scheme, host, port)
+
+
+def mock_urlopen(mocker: MockerFixture, data: bytes, sized: bool = True) -> Any:
+    class FakeResponse(io.BytesIO):
+        headers = Message()
+
+        def __exit__(self, *_exc: Any) -> None:
+            self.close()
+
+    if sized:
+        FakeResponse.headers["Content-Length"] = str(len(data))
+    return mocker.patch(
+        "datalad_installer.urlopen", side_effect=lambda _req: FakeResponse(data)
+    )
+
+
+@pytest.mark.parametrize("memory_max", [64 << 20, 0])
+def test_download_zipfile(
+    mocker: MockerFixture, tmp_path: Path, memory_max: int
+) -> None:
+    buf = io.BytesIO()
+    with ZipFile(buf, "w") as zf:
+        zf.writestr("foo/bar.txt", "Hello, world!\n")
+    mocker.patch("datalad_installer.MEMORY_DOWNLOAD_MAX", memory_max)
+    m = mock_urlopen(mocker, buf.getvalue())
+    download_zipfile("https://example.com/foo.zip", tmp_path / "target")
+    m.assert_called_once()
+    assert (tmp_path / "target" / "foo" / "bar.txt").read_text() == "Hello, world!\n"
+
+
+@pytest.mark.parametrize(
+    "memory_max,sized,in_memory",
+    [
+        (64 << 20, True, True),
+        (4, True, False),
+        (64 << 20, False, False),
+    ],
+)
+def test_download_to_buffer(
+    mocker: MockerFixture, memory_max: int, sized: bool, in_memory: bool
+) -> None:
+    mocker.patch("datalad_installer.MEMORY_DOWNLOAD_MAX", memory_max)
+    mock_urlopen(mocker, b"Hello, world!\n", sized=sized)
+    with download_to_buffer("https://example.com/hello.txt") as fp:
+        assert isinstance(fp, io.BytesIO) is in_memory
+        assert fp.read() == b"Hello, world!\n"